@@ -2,13 +2,93 @@
 Table data structure that supports the introduction of user-defined workflow
 combinators and the use of these combinators in concise workflow descriptions.
 """
+# pylint: disable=too-many-lines
 from __future__ import annotations
 from typing import Any, Union, Optional, Callable, Iterable
 import doctest
+import math
 import itertools
+import functools
+import collections
+import weakref
+import concurrent.futures
 import symbolism
 
-class metatable:
+_OPERATORS = (
+    (symbolism.add_.instance, '({} + {})'),
+    (symbolism.sub_.instance, '({} - {})'),
+    (symbolism.mul_.instance, '({} * {})'),
+    (symbolism.truediv_.instance, '({} / {})'),
+    (symbolism.floordiv_.instance, '({} // {})'),
+    (symbolism.mod_.instance, '({} % {})'),
+    (symbolism.pow_.instance, '({} ** {})'),
+    (symbolism.neg_.instance, '(-{})'),
+    (symbolism.pos_.instance, '(+{})'),
+    (symbolism.eq_.instance, '({} == {})'),
+    (symbolism.ne_.instance, '({} != {})'),
+    (symbolism.lt_.instance, '({} < {})'),
+    (symbolism.le_.instance, '({} <= {})'),
+    (symbolism.gt_.instance, '({} > {})'),
+    (symbolism.ge_.instance, '({} >= {})'),
+    (symbolism.and_.instance, '({} and {})'),
+    (symbolism.or_.instance, '({} or {})'),
+    (symbolism.not_.instance, '(not {})')
+)
+"""
+Python source templates for the symbolic operators that are supported by
+:obj:`metatable._source`.
+"""
+
+_FLOATING = tuple(o for (o, _) in _OPERATORS[:6] + _OPERATORS[7:9])
+"""
+Symbolic operators that yield a :obj:`float` value whenever they are applied to
+:obj:`float` values or to a mix of :obj:`float` and :obj:`int` values (see
+:obj:`metatable._numeric`).
+"""
+
+_COMPARISONS = tuple(o for (o, _) in _OPERATORS[9:15])
+"""
+Symbolic comparison operators (see :obj:`metatable._numeric`).
+"""
+
+_NONES = [None] * 256
+"""
+Buffer of ``None`` values from which the padding for each row is taken
+(see :obj:`metatable._upd`).
+"""
+
+_DIVISIONS = tuple(o for (o, _) in _OPERATORS[3:6])
+"""
+Symbolic operators that raise an exception if their second argument is zero
+(see :obj:`metatable._vectorize`).
+"""
+
+_plan = collections.namedtuple( # pylint: disable=invalid-name
+    '_plan',
+    ['assigns', 'drops', 'pad_to', 'filter', 'column_max', 'copy']
+)
+"""
+Compiled tasks that are applied to each row by :obj:`metatable._upd` (see
+:obj:`metatable._tasks`).
+"""
+
+class _derived(functools.partial): # pylint: disable=invalid-name,too-few-public-methods
+    """
+    Partial application of a function that is applied to every row during an
+    update-then-filter operation (see :obj:`metatable._function`). Only the
+    specification from which the partial application was derived is serialized,
+    so it can be sent to another process (*e.g.*, by a derived class that
+    redefines :obj:`metatable.map`) and derived again within that process.
+    """
+    def __new__(cls, specification: tuple, function: Callable, *args):
+        self = super().__new__(cls, function, *args)
+        self.specification = specification
+        return self
+
+    def __reduce__(self: _derived) -> tuple:
+        return (metatable._function, self.specification)
+
+class metatable: # pylint: disable=too-many-instance-attributes
     """
     Class for the extensible metatable data structure.
 
@@ -31,62 +111,785 @@ class metatable:
     Find more examples under the entries for the :obj:`update` and
     :obj:`update_filter` methods.
     """
+    _compiled = {}
+    """
+    Cache of compiled symbolic expressions (see :obj:`_compile`), keyed by the
+    identifier of each expression.
+    """
+
+    _generated = {}
+    """
+    Cache of generated functions (see :obj:`_codegen`), keyed by the identifiers
+    of the expressions from which each function was generated.
+    """
+
     @staticmethod
-    def _eval(r: list, i: int, e: Union[column, type, symbolism.symbol]) -> Any:
+    def _compile(e: Union[column, type, symbolism.symbol]) -> Callable[[list, int], Any]:
         """
-        Evaluation of a symbolic expression that may contain
-        references to specific attributes/columns of a row.
+        Compilation of a symbolic expression (that may contain references to
+        specific attributes/columns of a row) into a function that takes a row
+        and its index. The expression is traversed only once, so the resulting
+        function can be applied to every row without determining again the kind
+        of each part of the expression.
+
+        >>> f = metatable._compile(symbolism.add_(column(0), column(1)))
+        >>> f([1, 2], 0)
+        3
+        >>> metatable._compile(column(2))([1, 2], 0) is None
+        True
+        >>> metatable._compile(row)([1, 2], 5)
+        5
+        >>> metatable._compile(symbolism.eq_(column(0), 1))([1, 2], 0)
+        True
+        >>> class named(column):
+        ...     pass
+        >>> metatable._compile(named(1) + symbolism.symbol(3))([1, 2], 0)
+        5
+
+        Only a symbol that has no parameters is treated as a constant. A function
+        that is applied to zero arguments is applied again for every row.
+
+        >>> counter = itertools.count()
+        >>> f = metatable._compile(symbolism.symbol(lambda: next(counter))())
+        >>> (f([1, 2], 0), f([1, 2], 1))
+        (0, 1)
+
+        The compiled function for each symbolic expression instance is retained
+        (for as long as that instance exists) and is reused whenever the same
+        instance is compiled again.
+
+        >>> e = column(0) + column(1)
+        >>> metatable._compile(e) is metatable._compile(e)
+        True
+        """
+        if isinstance(e, column):
+            k = e._index # pylint: disable=protected-access
+            return lambda r, i, k=k: r[k] if k < len(r) else None
+
+        if e is row:
+            return lambda r, i: i
+
+        if not isinstance(e, symbolism.symbol):
+            return lambda r, i, v=e: v
+
+        (key, entry) = (id(e), metatable._compiled.get(id(e)))
+        if entry is not None and entry[0]() is e:
+            return entry[1]
+
+        # A symbol without parameters is a constant, but a symbol that represents
+        # an application of a function to zero arguments is not.
+        function = (
+            (lambda r, i, v=e.instance: v)
+            if e.parameters is None else
+            (
+                lambda r, i, op=e.instance, ps=[metatable._compile(p) for p in e.parameters]:
+                    op(*[f(r, i) for f in ps])
+            )
+        )
+
+        # The entry is removed once the expression no longer exists (so that the
+        # identifier of the expression cannot be reused by a different one).
+        metatable._compiled[key] = (
+            weakref.ref(e, lambda _: metatable._compiled.pop(key, None)),
+            function
+        )
+        return function
+
+    @staticmethod
+    def _source(
+            e: Union[column, type, symbolism.symbol],
+            columns: set,
+            namespace: Optional[dict] = None
+        ) -> Optional[str]:
+        """
+        Translation of a symbolic expression into a Python expression (in which
+        a reference to a column ``k`` is represented by the variable ``ck`` and
+        the row index is represented by the variable ``i``). The indices of all
+        columns that are referenced are added to the supplied set. Only numeric
+        constants and arithmetic, comparison, and boolean operators are supported;
+        ``None`` is returned for any other expression.
+
+        >>> columns = set()
+        >>> metatable._source(column(0) + column(2) > symbolism.symbol(1), columns)
+        '((c0 + c2) > 1)'
+        >>> sorted(columns)
+        [0, 2]
+        >>> metatable._source(row, columns)
+        'i'
+        >>> metatable._source(symbolism.is_(column(1), None), columns) is None
+        True
+        >>> metatable._source(column(1) + 'a', columns) is None
+        True
+        >>> metatable._source(column('a'), columns) is None
+        True
+        >>> metatable._source(symbolism.add_(x=column(0), y=column(1)), columns) is None
+        True
+
+        If a namespace is supplied, any other functions and constants are added
+        to the namespace and are referenced by name (and the boolean operators are
+        applied as functions so that both of their arguments are always evaluated,
+        as in :obj:`_compile`).
+
+        >>> namespace = {}
+        >>> metatable._source(symbolism.is_(column(1), None), columns, namespace)
+        '_0(c1, _1)'
+        >>> namespace['_1'] is None
+        True
+        >>> metatable._source(symbolism.and_(column(1), True), columns, namespace)
+        '_2(c1, True)'
+        >>> import enum
+        >>> flag = enum.IntEnum('flag', ['on'])
+        >>> metatable._source(column(1) == flag.on, columns, namespace)
+        '(c1 == _3)'
+        >>> namespace['_3'] is flag.on
+        True
+        """
+        if isinstance(e, column):
+            k = e._index # pylint: disable=protected-access
+            columns.add(k)
+            return 'c' + str(k) if isinstance(k, int) and k >= 0 else None
+
+        if e is row:
+            return 'i'
+
+        # Unwrap constants, and translate each supported operator application.
+        if isinstance(e, symbolism.symbol) and e.parameters is None:
+            e = e.instance
+        elif isinstance(e, symbolism.symbol) and isinstance(e.parameters, dict):
+            return None
+        elif isinstance(e, symbolism.symbol):
+            template = next((t for (o, t) in _OPERATORS if o is e.instance), None)
+            if namespace is not None and (
+                template is None or
+                e.instance is symbolism.and_.instance or e.instance is symbolism.or_.instance
+            ):
+                namespace['_' + str(len(namespace))] = e.instance
+                template = '_' + str(len(namespace) - 1) + '(' + \
+                    ', '.join(['{}'] * len(e.parameters)) + ')'
+
+            parameters = (
+                [] if template is None else
+                [metatable._source(p, columns, namespace) for p in e.parameters]
+            )
+            return (
+                None if template is None or None in parameters else
+                template.format(*parameters)
+            )
+
+        # Only constants of the exact built-in types are written into the source
+        # (so that, for example, an instance of a subclass of :obj:`int` is not
+        # converted into an :obj:`int`).
+        exact = type(e) in (bool, int, float) # pylint: disable=unidiomatic-typecheck
+        constant = e if exact and (not isinstance(e, float) or math.isfinite(e)) else None
+        if constant is None and namespace is not None:
+            namespace['_' + str(len(namespace))] = e
+            return '_' + str(len(namespace) - 1)
+
+        return None if constant is None else repr(constant)
+
+    @staticmethod
+    def _numeric(
+            e: Union[column, type, symbolism.symbol],
+            floats: set
+        ) -> Optional[type]:
+        """
+        Determine the type of the value of a symbolic expression if every column
+        that is in the supplied set contains a :obj:`float` value (the row index
+        is always an :obj:`int` value). The type is determined only if evaluating
+        the expression using double-precision floating-point arithmetic is certain
+        to yield exactly the result that Python yields; ``None`` is returned for
+        any other expression (including any integer arithmetic, which could
+        overflow).
+
+        >>> metatable._numeric(column(0) * column(1) + row, {0, 1})
+        <class 'float'>
+        >>> metatable._numeric(column(0) > symbolism.symbol(1), {0})
+        <class 'bool'>
+        >>> metatable._numeric(column(0) * column(1), {0}) is None
+        True
+        >>> metatable._numeric(symbolism.mul_(row, 2), set()) is None
+        True
+        >>> metatable._numeric(column(0) ** 2, {0}) is None
+        True
+        >>> metatable._numeric(column(0) + 2 ** 60, {0}) is None
+        True
+        """
+        if isinstance(e, column):
+            return float if e._index in floats else None # pylint: disable=protected-access
+
+        if e is row:
+            return int
+
+        if isinstance(e, symbolism.symbol) and e.parameters is None:
+            e = e.instance
+        elif isinstance(e, symbolism.symbol):
+            types = (
+                [None] if isinstance(e.parameters, dict) else
+                [metatable._numeric(p, floats) for p in e.parameters]
+            )
+            if float not in types or not all(t in (float, int) for t in types):
+                return None
+            return (
+                float if any(o is e.instance for o in _FLOATING) else
+                bool if any(o is e.instance for o in _COMPARISONS) else
+                None
+            )
+
+        # Integer constants must be represented exactly as floating-point values.
+        return ( # pylint: disable=unidiomatic-typecheck
+            float if type(e) is float and math.isfinite(e) else
+            int if type(e) is int and abs(e) <= 2 ** 53 else
+            None
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _loop(columns: tuple, source: str, result: type) -> Callable:
+        """
+        Compile (using `Numba <https://numba.pydata.org>`__) a function that takes
+        an array of floating-point numbers for each of the supplied column indices
+        and the number of rows, and that evaluates the supplied Python expression
+        (see :obj:`_source`) for every row within a single loop, yielding an array
+        of values of the supplied result type. The most recently compiled functions
+        are retained so that each one is reused whenever the same expression is
+        compiled again. An :obj:`ImportError` is raised if Numba is not installed.
+        """
+        import numpy # pylint: disable=import-outside-toplevel
+        import numba # pylint: disable=import-outside-toplevel
+
+        namespace = {'numpy': numpy}
+        exec( # pylint: disable=exec-used
+            compile(
+                'def function(' + ''.join('a' + str(k) + ', ' for k in columns) + 'n):\n' +
+                '    values = numpy.empty(n, numpy.' +
+                    ('float64' if result is float else 'bool_') + ')\n' +
+                '    for i in range(n):\n' +
+                ''.join('        c' + str(k) + ' = a' + str(k) + '[i]\n' for k in columns) +
+                '        values[i] = ' + source + '\n' +
+                '    return values\n',
+                '<metatable>',
+                'exec'
+            ),
+            namespace
+        )
+        return numba.njit(
+            (numba.float64[:],) * len(columns) + (numba.int64,)
+        )(namespace['function'])
+
+    @staticmethod
+    def _vectorize( # pylint: disable=too-many-return-statements
+            e: Union[column, type, symbolism.symbol],
+            columns: list,
+            jit: bool = False
+        ) -> Optional[Callable[[list, int], Any]]:
+        """
+        Compilation of a symbolic expression into a function that takes the supplied
+        list of columns (each represented as a NumPy array) and the number of rows,
+        and that evaluates the expression for all rows at once. Only references to
+        existing columns, the row index, constants, and operator applications for
+        which the result is certain to be the same as that of the corresponding
+        Python operation (see :obj:`_numeric`) are supported; ``None`` is returned
+        for any other expression.
+
+        >>> import numpy
+        >>> cs = [numpy.array([1.0, 2.0]), numpy.array([3.0, 4.0])]
+        >>> metatable._vectorize(column(0) * column(1) + row, cs)(cs, 2).tolist()
+        [3.0, 9.0]
+        >>> metatable._vectorize(column(2), cs) is None
+        True
+        >>> metatable._vectorize(symbolism.not_(column(1)), cs) is None
+        True
+        >>> metatable._vectorize(column(0) + symbolism.symbol(list)(), cs) is None
+        True
+
+        Integer arithmetic is not supported (as it could overflow), and division
+        by zero raises an exception (as it would in Python).
+
+        >>> metatable._vectorize(column(0) * 2, [numpy.array([2 ** 40])]) is None
+        True
+        >>> metatable._vectorize(column(0) / column(1), cs)(cs[::-1], 2).tolist()
+        [3.0, 2.0]
+        >>> metatable._vectorize(column(0) / (column(1) - 3), cs)(cs, 2)
+        Traceback (most recent call last):
+          ...
+        ZeroDivisionError: division by zero
+
+        If ``jit`` is ``True``, an operator application is compiled into a single
+        loop over all rows using :obj:`_loop` (if Numba is installed) rather than
+        being evaluated one operator at a time.
+
+        >>> f = metatable._vectorize(column(0) * column(1) + row > 5, cs, jit=True)
+        >>> f(cs, 2).tolist()
+        [False, True]
         """
+        import numpy # pylint: disable=import-outside-toplevel
+
         if isinstance(e, column):
-            index = e.evaluate()
-            return r[index] if index < len(r) else None
+            k = e._index # pylint: disable=protected-access
+            return (
+                (lambda cs, n, k=k: cs[k])
+                if isinstance(k, int) and 0 <= k < len(columns) else
+                None
+            )
 
         if e is row:
-            return i
+            return lambda cs, n: numpy.arange(n)
+
+        # Numeric constants are used as they are, but any other constant fills an
+        # entire column (so that a sequence is not treated as a column of values).
+        if not isinstance(e, symbolism.symbol) or e.parameters is None:
+            value = e.instance if isinstance(e, symbolism.symbol) else e
+            return (
+                (lambda cs, n, v=value: v)
+                if type(value) in (int, float) else # pylint: disable=unidiomatic-typecheck
+                (lambda cs, n, v=value: metatable._full(n, v))
+            )
+
+        floats = {k for (k, c) in enumerate(columns) if c.dtype == numpy.float64}
+        result = metatable._numeric(e, floats)
+        if result is None:
+            return None
+
+        if jit:
+            ks = set()
+            source = metatable._source(e, ks)
+            try:
+                loop = metatable._loop(tuple(sorted(ks)), source, result)
+                return lambda cs, n: loop(*[cs[k] for k in sorted(ks)], n)
+            except ImportError: # pragma: no cover
+                pass
+
+        (op, ps) = (e.instance, [metatable._vectorize(p, columns) for p in e.parameters])
+        if any(op is o for o in _DIVISIONS):
+            def function(cs, n):
+                (x, y) = (ps[0](cs, n), ps[1](cs, n))
+                if numpy.any(numpy.asarray(y) == 0):
+                    raise ZeroDivisionError('division by zero')
+                return op(x, y)
+            return function
+
+        return lambda cs, n: op(*[f(cs, n) for f in ps])
+
+    @staticmethod
+    def _full(n: int, value: Any) -> Any:
+        """
+        Create an array of length ``n`` in which every entry is the supplied value
+        (even if that value is itself a sequence).
+
+        >>> metatable._full(2, (1, 2)).tolist()
+        [(1, 2), (1, 2)]
+        """
+        import numpy # pylint: disable=import-outside-toplevel
+        array = numpy.empty(n, dtype=object)
+        array.fill(value)
+        return array
+
+    @staticmethod
+    def _array(values: Iterable) -> Any:
+        """
+        Create an array that contains the supplied values. A sequence of
+        :obj:`float` values is stored as an array of floating-point numbers, but
+        any other values are stored exactly as they are.
 
-        if isinstance(e, symbolism.symbol):
-            return \
-                e.evaluate() \
-                if len(e) == 0 else \
-                e.instance(*[metatable._eval(r, i, p) for p in e.parameters])
+        >>> metatable._array([0.5, 1.5]).dtype
+        dtype('float64')
+        >>> metatable._array(['a', 1, (2, 3)]).tolist()
+        ['a', 1, (2, 3)]
+        """
+        import numpy # pylint: disable=import-outside-toplevel
+        values = list(values)
+        if len(values) > 0 and all(type(v) is float for v in values): # pylint: disable=unidiomatic-typecheck
+            return numpy.array(values, dtype=numpy.float64)
 
-        return e
+        array = numpy.empty(len(values), dtype=object)
+        for (i, value) in enumerate(values):
+            array[i] = value
+        return array
 
     @staticmethod
-    def _upd(update_filter_index_row: tuple) -> list:
+    def _columns(e: Union[column, type, symbolism.symbol]) -> set:
+        """
+        Determine the set of columns that are referenced within a symbolic
+        expression.
+
+        >>> sorted(metatable._columns(symbolism.add_(column(0), column(2))))
+        [0, 2]
+        >>> metatable._columns(row)
+        set()
+        """
+        if isinstance(e, column):
+            return {e.evaluate()}
+
+        if isinstance(e, symbolism.symbol) and len(e) > 0:
+            return set().union(*[metatable._columns(p) for p in e.parameters])
+
+        return set()
+
+    @staticmethod
+    def _drops(update: dict) -> tuple:
+        """
+        Determine the columns that are dropped by an update task specification
+        (in descending order of index, so that each column can be deleted without
+        shifting the others). Only non-negative integer indices refer to columns
+        that can be dropped (any other index is ignored).
+
+        >>> metatable._drops({0: drop, 1: row, 2: drop, -1: drop})
+        (2, 0)
+        """
+        return tuple(sorted(
+            (
+                col for (col, upd) in update.items()
+                if upd is drop and isinstance(col, int) and col >= 0
+            ),
+            reverse=True
+        ))
+
+    @staticmethod
+    def _pad_row(r: list, pad_to: int):
+        """
+        Fill a row with ``None`` values (in-place) so that it has a column
+        at the specified index.
+
+        >>> r = ['a']
+        >>> metatable._pad_row(r, 2)
+        >>> r
+        ['a', None, None]
+        """
+        padding = pad_to + 1 - len(r)
+        if padding > 0:
+            r.extend(_NONES[:padding] if padding <= len(_NONES) else [None] * padding)
+
+    @staticmethod
+    def _assign(assigns: tuple, pad_to: int, index_row: tuple) -> list:
+        """
+        Internal method for the work to be completed for each row during an
+        invocation of an update on the table that involves only assignments
+        (*i.e.*, no filter, no strict mode, no dropped columns, and no update
+        task that reads a column assigned by an earlier one). The row is
+        updated in place and returned (within a list, as in :obj:`_upd`).
+
+        >>> assign = functools.partial(metatable._assign, ((2, metatable._compile(row)),), 2)
+        >>> list(map(assign, enumerate([['a'], ('b',)])))
+        [[['a', None, 0]], [['b', None, 1]]]
+        """
+        (index, row_) = index_row
+
+        # Rows that are not lists (such as tuples) are converted so that they
+        # can be updated in place.
+        if not isinstance(row_, list):
+            row_ = list(row_)
+
+        if pad_to >= len(row_):
+            metatable._pad_row(row_, pad_to)
+
+        for (col_, upd) in assigns:
+            row_[col_] = upd(row_, index)
+
+        return [row_]
+
+    @staticmethod
+    def _upd(tasks: tuple, index_row: tuple) -> Optional[list]:
         """
         Internal method for the work to be completed for each row
-        during an invocation of an update on the table.
+        during an invocation of an update on the table. The compiled
+        tasks (see :obj:`_tasks`) are bound once for all rows (using
+        :obj:`functools.partial`). A list containing the updated row is
+        returned, or an empty list if the row was filtered out.
+
+        >>> upd = functools.partial(metatable._upd, metatable._tasks({2: row}, None, False))
+        >>> list(map(upd, enumerate([['a'], ['b']])))
+        [[['a', None, 0]], [['b', None, 1]]]
+        >>> tasks = metatable._tasks({1: column(0), 0: drop}, column(0) > 'a', True)
+        >>> list(map(functools.partial(metatable._upd, tasks), enumerate([('a', 0), ('b', 1)])))
+        [[], [['b']]]
+        >>> tasks = metatable._tasks({0: column(1), 1: column(0)}, column(0) > 0, False)
+        >>> list(map(functools.partial(metatable._upd, tasks), enumerate([[1, 0], [0, 2]])))
+        [[], [[2, 0]]]
         """
-        ((update, filter_, column_max), (index, row_)) = update_filter_index_row
+        (assigns, drops, pad_to, filter_, column_max, copy) = tasks
+        (index, row_) = index_row
+
+        # Rows that are not lists (such as tuples) are converted so that they
+        # can be updated in place.
+        if not isinstance(row_, list):
+            row_ = list(row_)
 
         # Fill columns that are in the range but that have no expression
         # in the update tasks.
-        for col in update:
-            while col > len(row_) - 1:
-                row_.append(None)
-
-        drops = [] # Columns to drop once updates are evaluated.
-        row__ = list(row_)
+        if pad_to >= len(row_):
+            metatable._pad_row(row_, pad_to)
 
-        # In strict mode, drop columns which do not appear in the update task.
+        # In strict mode, drop columns which do not appear in the update task
+        # (the slice is a new list, so no other copy is needed, and its bound is
+        # never negative, so no column is kept if every index in the update task
+        # is negative). Otherwise, the row is only copied if updating it in place
+        # could affect the evaluation of the update tasks.
         if column_max is not None:
-            row__ = [v for (c, v) in enumerate(row__) if c <= column_max]
+            row__ = row_[:column_max + 1]
+        else:
+            row__ = list(row_) if copy else row_
 
-        for (col_, upd) in update.items():
-            if upd is not drop:
-                row__[col_] = metatable._eval(row_, index, upd)
-            else:
-                drops.append(col_)
+        for (col_, upd) in assigns:
+            row__[col_] = upd(row_, index)
 
         # Apply filter first and then drop columns.
-        if filter_ is None or metatable._eval(row__, index, filter_):
-            row__ = [v for (c, v) in enumerate(row__) if c not in drops] # Drop columns.
+        if filter_ is None or filter_(row__, index):
+            for col_ in drops: # Drop columns (in descending order of index).
+                del row__[col_]
             return [row__]
 
         # Row was filtered out.
         return []
 
+    @staticmethod
+    def _codegen( # pylint: disable=too-many-locals
+            update: dict,
+            filter: symbolism.symbol, # pylint: disable=redefined-builtin
+            strict: bool,
+            width: int
+        ) -> Optional[Callable[[tuple], list]]:
+        """
+        Generation of a function that completes all the work for a row (*i.e.*,
+        the work completed by :obj:`_upd`) that is specialized to the supplied
+        update task specification and filter expression, and to rows that have
+        at least ``width`` columns. The function takes a pair consisting of the
+        row index and the row, and its body consists of straight-line Python
+        source code (generated using :obj:`_source`) in which only the columns
+        that are referenced are read from the row. ``None`` is returned if an
+        expression cannot be translated.
+
+        >>> f = metatable._codegen({0: column(1), 1: column(0)}, column(0) > 0, False, 2)
+        >>> (f((0, [1, 2])), f((1, [2, 0])))
+        ([[2, 1]], [])
+        >>> f = metatable._codegen({3: row, 0: drop}, symbolism.is_(column(4), None), True, 2)
+        >>> f((5, ['a', 'b']))
+        [['b', None, 5]]
+        >>> f = metatable._codegen({1: column(1) / 0}, column(0) > 0, False, 2)
+        >>> f((0, [0, 1]))
+        Traceback (most recent call last):
+          ...
+        ZeroDivisionError: division by zero
+
+        Rows that are not lists (such as tuples) are converted into lists (so that
+        the result is always a list, even in strict mode).
+
+        >>> metatable._codegen({1: row}, None, True, 2)((0, ('a', 'b', 'c')))
+        [['a', 0]]
+        >>> metatable._codegen({0: column('a')}, None, False, 2) is None
+        True
+        >>> metatable._codegen({}, column('a'), False, 2) is None
+        True
+        >>> metatable._codegen({-1: 5}, None, False, 2) is None
+        True
+
+        The generated function is retained (for as long as the expressions in the
+        update task specification and the filter expression exist) and is reused
+        whenever the same expressions are supplied again.
+
+        >>> (update, filter_) = ({0: column(1) + column(0)}, column(0) > 0)
+        >>> f = metatable._codegen(update, filter_, False, 2)
+        >>> f is metatable._codegen(update, filter_, False, 2)
+        True
+        >>> update = {1: 1.5}
+        >>> metatable._codegen(update, None, False, 2) is metatable._codegen(update, None, False, 2)
+        False
+        """
+        # Only functions generated from symbolic expressions (and from the objects
+        # :obj:`row`, :obj:`drop`, and ``None``) are retained, as any other object
+        # would otherwise remain in the cache indefinitely.
+        key = (tuple((col, id(upd)) for (col, upd) in update.items()), id(filter), strict, width)
+        objects = list(update.values()) + [filter]
+        retain = all(
+            isinstance(o, symbolism.symbol) or o is row or o is drop or o is None
+            for o in objects
+        )
+        entry = metatable._generated.get(key) if retain else None
+        if entry is not None and all(
+            (o() if isinstance(e, symbolism.symbol) else o) is e
+            for (o, e) in zip(entry[0], objects)
+        ):
+            return entry[1]
+
+        # Only update tasks for columns with non-negative integer indices can be
+        # translated (as each such column is represented by a variable).
+        if not all(isinstance(col, int) and col >= 0 for col in update):
+            return None
+
+        # Translate the expressions, collecting the columns that are referenced.
+        (namespace, columns, filter_columns) = ({'_pad_row': metatable._pad_row}, set(), set())
+        assigns = {
+            col: metatable._source(upd, columns, namespace)
+            for (col, upd) in update.items() if upd is not drop
+        }
+        filter_ = None if filter is None else metatable._source(filter, filter_columns, namespace)
+        if None in assigns.values() or (filter is not None and filter_ is None):
+            return None
+
+        # Pad the row only if it may not be wide enough (in which case the number
+        # of columns that are known to exist increases).
+        column_max = max(update) if update else -1
+        pad_to = column_max if column_max >= width else -1
+        known = max(width, pad_to + 1)
+        lines = ['(i, r) = index_row', 'if not isinstance(r, list): r = list(r)']
+        if pad_to >= 0:
+            lines.append('if ' + str(pad_to) + ' >= len(r): _pad_row(r, ' + str(pad_to) + ')')
+
+        # Read the referenced columns (the filter is applied to the updated row and,
+        # in strict mode, cannot see columns beyond those in the update task).
+        for k in sorted(columns | {
+            k for k in filter_columns
+            if k not in assigns and not (strict and k > column_max)
+        }):
+            lines.append(
+                'c' + str(k) + ' = r[' + str(k) + ']' +
+                ('' if k < known else ' if ' + str(k) + ' < len(r) else None')
+            )
+
+        # The filter is applied after all update tasks are evaluated, so any column
+        # it reads that is assigned (or, in strict mode, truncated) is replaced.
+        lines.extend('v' + str(col) + ' = ' + source for (col, source) in assigns.items())
+        if filter_ is not None:
+            lines.extend(
+                'c' + str(k) + ' = ' + ('v' + str(k) if k in assigns else 'None')
+                for k in sorted(filter_columns)
+                if k in assigns or (strict and k > column_max)
+            )
+            lines.append('if not ' + filter_ + ': return []')
+
+        if strict:
+            lines.append('r = r[:' + str(column_max + 1) + ']')
+        lines.extend('r[' + str(col) + '] = v' + str(col) for col in assigns)
+        lines.extend(
+            'del r[' + str(col) + ']'
+            for col in metatable._drops(update)
+        )
+        lines.append('return [r]')
+
+        exec( # pylint: disable=exec-used
+            compile(
+                'def function(index_row):\n' + ''.join('    ' + l + '\n' for l in lines),
+                '<metatable>',
+                'exec'
+            ),
+            namespace
+        )
+
+        # The entry is removed once any of the expressions no longer exists.
+        if retain:
+            metatable._generated[key] = (
+                tuple(
+                    weakref.ref(e, lambda _: metatable._generated.pop(key, None))
+                    if isinstance(e, symbolism.symbol) else e
+                    for e in objects
+                ),
+                namespace['function']
+            )
+        return namespace['function']
+
+    @staticmethod
+    def _tasks(
+            update: dict,
+            filter: symbolism.symbol, # pylint: disable=redefined-builtin
+            strict: bool
+        ) -> _plan:
+        """
+        Internal method that derives (from an update task specification and a
+        filter expression) the compiled tasks that are applied to each row by
+        :obj:`_upd`.
+        """
+        # Split the update task into the columns to be assigned and the columns
+        # to be dropped (see :obj:`_drops`), and determine the column with the
+        # highest index in the update task (so that these need not be derived again
+        # for every row).
+        assigns = tuple(
+            (col, metatable._compile(upd))
+            for (col, upd) in update.items() if upd is not drop
+        )
+        drops = metatable._drops(update)
+        column_max = max(update) if update else -1
+
+        # Determine whether any update task reads a column that is assigned by
+        # an earlier update task (in which case each row must be copied so that
+        # every update task is evaluated using the original values in the row).
+        # An index that is not a non-negative integer (such as a negative index)
+        # may refer to any column, so it is assumed to refer to an assigned one.
+        (assigned, copy) = (set(), False)
+        for (col, upd) in update.items():
+            if upd is not drop:
+                reads = metatable._columns(upd)
+                copy = copy or (len(assigned) > 0 and len(reads) > 0 and (
+                    not assigned.isdisjoint(reads) or
+                    not all(isinstance(k, int) and k >= 0 for k in reads | assigned)
+                ))
+                assigned.add(col)
+
+        return _plan(
+            assigns,
+            drops,
+            column_max,
+            None if filter is None else metatable._compile(filter),
+            max(column_max, -1) if strict else None,
+            copy
+        )
+
+    @staticmethod
+    def _function(
+            update: dict,
+            filter: symbolism.symbol, # pylint: disable=redefined-builtin
+            strict: bool,
+            width: int = 0
+        ) -> Callable[[tuple], list]:
+        """
+        Internal method that derives (from an update task specification and a
+        filter expression) the function that is applied to each pair consisting
+        of a row index and a row (where every row is known to have at least
+        ``width`` columns) during an update-then-filter operation. The function
+        can be serialized, in which case it is derived again (and its expressions
+        are compiled again) when it is deserialized.
+
+        >>> import pickle
+        >>> f = pickle.loads(pickle.dumps(metatable._function({1: row}, column(1) > 0, False)))
+        >>> (f((0, ['a'])), f((1, ['b'])))
+        ([], [['b', 1]])
+        >>> metatable._function({0: column(-1)}, None, False, width=2)((0, ['a', 'b']))
+        [['b', 'b']]
+        """
+        specification = (update, filter, strict, width)
+
+        # Use a function generated specifically for this operation (if the
+        # expressions can be translated).
+        function = metatable._codegen(update, filter, strict, width)
+        if function is not None:
+            return _derived(specification, function)
+
+        # Rows need not be padded if they are all known to be wide enough.
+        tasks = metatable._tasks(update, filter, strict)
+        if tasks.pad_to < width:
+            tasks = tasks._replace(pad_to=-1)
+
+        # If the operation only assigns columns (which is the most common case),
+        # use a function that performs only that work for each row.
+        if filter is None and not strict and len(tasks.drops) == 0 and not tasks.copy:
+            return _derived(specification, metatable._assign, tasks.assigns, tasks.pad_to)
+
+        # The compiled tasks are bound to the per-row function once (rather than
+        # being paired with every row).
+        return _derived(specification, metatable._upd, tasks)
+
+    @staticmethod
+    def _upd_chunk(function: Callable[[tuple], list], index_rows: list) -> list:
+        """
+        Internal method for the work to be completed for a contiguous chunk
+        of rows (within a separate process) during an invocation of an update
+        on the table. The supplied function (see :obj:`_function`) is applied
+        to each pair consisting of a row index and a row.
+
+        >>> f = metatable._function({1: row}, column(1) > 0, False)
+        >>> metatable._upd_chunk(f, [(0, ['a']), (1, ['b'])])
+        [[], [['b', 1]]]
+        """
+        return list(map(function, index_rows))
+
     def __init__(
             self: metatable,
             iterable: Iterable,
@@ -100,10 +903,169 @@ class metatable:
         >>> list(t)
         [['a', 0], ['b', 1], ['c', 2]]
         """
-        self.iterable = iterable
+        self._iterable = iterable
         self.name = name
         self.header = header
 
+        # Column-major representation (used only by instances that are
+        # created using :obj:`from_columns` until they are converted).
+        self._arrays = None
+        self._length = None
+        self._header = None
+
+        # Update-then-filter operations that have been deferred (see the
+        # ``lazy`` parameter of :obj:`update_filter`).
+        self._pending = []
+
+    @classmethod
+    def from_columns(
+            cls,
+            columns: Union[dict, Iterable],
+            name: Optional[str] = None,
+            header: Optional[list] = None
+        ) -> metatable:
+        """
+        Create a table instance from a collection of columns, each of which is
+        stored as a `NumPy <https://numpy.org>`__ array. The columns can be
+        supplied as an iterable or as a dictionary that maps each column index
+        to a column.
+
+        :param columns: Columns (all of which must have the same length).
+        :param name: Instance name.
+        :param header: Header row consisting of column names.
+
+        >>> import numpy
+        >>> t = metatable.from_columns([numpy.array([0.0, 1.0, 2.0]), [3.0, 4.0, 5.0]])
+        >>> list(t)
+        [[0.0, 3.0], [1.0, 4.0], [2.0, 5.0]]
+
+        Updates in which every expression refers only to existing columns (and in
+        which every operator application is certain to yield the same result as
+        it would for each row) are evaluated for all rows at once, with the columns
+        remaining in this representation.
+
+        >>> t.update({2: column(0) * column(1), 0: drop})
+        [[3.0, 0.0], [4.0, 4.0], [5.0, 10.0]]
+        >>> t._arrays is None
+        False
+        >>> t = metatable.from_columns({0: ['a', 'b'], 1: [0, 1]}, header=['c', 'n'])
+        >>> t.update([column(1), column(0)])
+        [['c', 'n'], [0, 'a'], [1, 'b']]
+        >>> t.update({2: 'x', 0: drop})
+        [['n', None], ['a', 'x'], ['b', 'x']]
+        >>> t.update([column(1)], strict=True, header=['s'])
+        [['s'], ['x'], ['x']]
+        >>> t.update({0: row, 2: (1, 2)})
+        [['s', None, None], [0, None, (1, 2)], [1, None, (1, 2)]]
+
+        Otherwise, the instance is converted into the usual row-major representation
+        before the update is performed.
+
+        >>> t.update({1: symbolism.is_(column(1), None)})
+        [['s', None, None], [0, True, (1, 2)], [1, True, (1, 2)]]
+        >>> metatable.from_columns([[0.5, 1.5], ['a', 'b']]).update({-1: column(0)})
+        [[0.5, 0.5], [1.5, 1.5]]
+        >>> t = metatable.from_columns([['a', 1], [2 ** 40, 2 ** 40]])
+        >>> t.update({2: column(1) * column(1), 0: drop})
+        [[1099511627776, 1208925819614629174706176], [1099511627776, 1208925819614629174706176]]
+        >>> metatable.from_columns([[1.0, 2.0], [1.0, 0.0]]).update({2: column(0) / column(1)})
+        Traceback (most recent call last):
+          ...
+        ZeroDivisionError: float division by zero
+
+        A filter that satisfies the same conditions is also evaluated for all rows
+        at once (after the update is performed), yielding a mask that is used to
+        select the rows that remain in every column.
+
+        >>> t = metatable.from_columns([[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+        >>> t.update_filter({2: column(0) + column(1)}, column(2) > 4)
+        [[1.0, 4.0, 5.0], [2.0, 5.0, 7.0]]
+        >>> t.update_filter({}, True)
+        [[1.0, 4.0, 5.0], [2.0, 5.0, 7.0]]
+        >>> t.update_filter({0: drop}, column(0) > 1, strict=True)
+        [[]]
+        >>> t.update_filter({0: 1}, symbolism.not_(column(0)))
+        []
+        >>> t = metatable.from_columns([[0.0, 1.0], [1.0, 0.0]])
+        >>> t.update_filter({2: [5]}, column(2))
+        [[0.0, 1.0, [5]], [1.0, 0.0, [5]]]
+        >>> t.update_filter({}, column(0) // column(1) < 1)
+        Traceback (most recent call last):
+          ...
+        ZeroDivisionError: float floor division by zero
+
+        Columns must all have the same length and must be indexed consecutively.
+
+        >>> metatable.from_columns({1: [0, 1]})
+        Traceback (most recent call last):
+          ...
+        ValueError: columns must be indexed consecutively starting from zero
+        >>> metatable.from_columns([[0, 1], [0]])
+        Traceback (most recent call last):
+          ...
+        ValueError: columns must all have the same length
+        """
+        import numpy # pylint: disable=import-outside-toplevel
+
+        if isinstance(columns, dict):
+            if sorted(columns) != list(range(len(columns))):
+                raise ValueError('columns must be indexed consecutively starting from zero')
+            columns = [columns[k] for k in range(len(columns))]
+
+        # Columns that are not arrays are stored using :obj:`_array` (so that their
+        # values are not converted).
+        columns = [c if isinstance(c, numpy.ndarray) else metatable._array(c) for c in columns]
+        if len({len(c) for c in columns}) > 1:
+            raise ValueError('columns must all have the same length')
+
+        table = cls(None, name, header is not None)
+        table._arrays = columns
+        table._length = len(columns[0]) if len(columns) > 0 else 0
+        table._header = header
+        return table
+
+    @property
+    def iterable(self: metatable) -> Iterable:
+        """
+        Iterable of rows corresponding to the data in this instance. Any deferred
+        operations are performed when this attribute is accessed, and an instance
+        created using :obj:`from_columns` is converted into the usual row-major
+        representation.
+
+        >>> t = metatable.from_columns([[0.5, 1.5], ['a', 'b']], header=['x', 'c'])
+        >>> t.iterable
+        [['x', 'c'], [0.5, 'a'], [1.5, 'b']]
+        >>> t.iterable = [['y', 'd'], [2.5, 'c']]
+        >>> list(t)
+        [['y', 'd'], [2.5, 'c']]
+        >>> t = metatable([['a'], ['b']]).update({1: row}, lazy=True)
+        >>> t.iterable
+        [['a', 0], ['b', 1]]
+        """
+        if len(self._pending) > 0:
+            self._flush()
+
+        if self._arrays is not None:
+            (self._iterable, self._arrays) = (list(self._iter_arrays()), None)
+
+        return self._iterable
+
+    @iterable.setter
+    def iterable(self: metatable, iterable: Iterable):
+        (self._iterable, self._arrays) = (iterable, None)
+
+    def _iter_arrays(self: metatable) -> Iterable:
+        """
+        Yield the rows (including the header row, if there is one) of an instance
+        that is in the column-major representation.
+        """
+        if self.header:
+            yield list(self._header)
+
+        yield from (
+            list(row_) for row_ in zip(*[c.tolist() for c in self._arrays])
+        ) if len(self._arrays) > 0 else ([] for _ in range(self._length))
+
     def __iter__(self: metatable) -> Iterable:
         """
         Return this instance as an iterable.
@@ -112,9 +1074,97 @@ class metatable:
         >>> list(iter(t))
         [['a', 0], ['b', 1], ['c', 2]]
         """
-        for row_ in self.iterable:
+        if len(self._pending) > 0:
+            self._flush()
+
+        if self._arrays is not None:
+            yield from self._iter_arrays()
+            return
+
+        for row_ in self._iterable:
             yield row_
 
+    def _update_columns( # pylint: disable=too-many-locals
+            self: metatable,
+            update: dict,
+            filter: symbolism.symbol, # pylint: disable=redefined-builtin
+            header: Optional[list],
+            strict: bool,
+            jit: bool = False
+        ) -> bool:
+        """
+        Internal method that attempts to perform an update-then-filter operation
+        directly on the columns of an instance created using :obj:`from_columns`.
+        The filter is evaluated for all rows at once to obtain a boolean mask that
+        is then used to select the remaining rows from every column. The result
+        indicates whether the operation could be performed in this way (if not,
+        the instance is left unchanged). If ``jit`` is ``True``, the expressions
+        are compiled as described in :obj:`_vectorize`.
+        """
+        import numpy # pylint: disable=import-outside-toplevel
+
+        # Only update tasks for columns with non-negative integer indices are
+        # supported (the others are handled by the operation on the rows).
+        if not all(isinstance(col, int) and col >= 0 for col in update):
+            return False
+
+        (n, column_max) = (self._length, max(update) if update else -1)
+        functions = {}
+        for (col, upd) in update.items():
+            if upd is not drop:
+                functions[col] = metatable._vectorize(upd, self._arrays, jit)
+                if functions[col] is None:
+                    return False
+
+        # Fill columns that are in the range but that have no expression in the
+        # update tasks. In strict mode, drop columns which do not appear in the
+        # update task. Then evaluate the filter using the updated columns. If any
+        # expression divides by zero, the operation is instead performed on the
+        # rows (so that the usual exception is raised).
+        try:
+            with numpy.errstate(all='ignore'):
+                columns = self._arrays + [
+                    metatable._full(n, None) for _ in range(len(self._arrays), column_max + 1)
+                ]
+                for (col, function) in functions.items():
+                    value = function(self._arrays, n)
+                    columns[col] = (
+                        value if isinstance(value, numpy.ndarray) else metatable._full(n, value)
+                    )
+
+                columns = columns[:max(column_max + 1, 0)] if strict else columns
+                filter_ = None if filter is None else metatable._vectorize(filter, columns, jit)
+                if filter is not None and filter_ is None:
+                    return False
+                mask = None if filter_ is None else filter_(columns, n)
+        except ZeroDivisionError:
+            return False
+
+        header_ = self._header
+        if self.header and header is None:
+            header_ = list(header_) + [None] * (column_max + 1 - len(header_))
+            header_ = header_[:max(column_max + 1, 0)] if strict else header_
+        elif self.header:
+            header_ = header
+
+        # Select the rows that satisfy the filter, and then drop the columns
+        # indicated in the update specification.
+        if mask is not None:
+            mask = (
+                mask.astype(bool) if isinstance(mask, numpy.ndarray) else
+                numpy.full(n, bool(mask))
+            )
+            columns = [c[mask] for c in columns]
+            self._length = int(numpy.count_nonzero(mask))
+
+        for col in metatable._drops(update):
+            del columns[col]
+            if self.header and header is None:
+                del header_[col]
+
+        (self._arrays, self._header) = (columns, header_)
+        return True
+
     def map(
             self: metatable,
             function: Callable,
@@ -134,21 +1184,145 @@ class metatable:
         >>> t = metatable([['a', 0], ['b', 1], ['c', 2]])
         >>> list(t.map(lambda row: [[row[1], row[0]]], t, lambda _: _))
         [[0, 'a'], [1, 'b'], [2, 'c']]
+
+        The function that is supplied to this method by operations such as
+        :obj:`update_filter` can be serialized via :obj:`pickle`, so a derived
+        class can distribute the work across multiple processes.
+
+        >>> import multiprocessing
+        >>> class pooled(metatable):
+        ...     def map(self, function, iterable, progress):
+        ...         with multiprocessing.Pool(2) as pool:
+        ...             results = pool.map(function, iterable)
+        ...         return (row for rows in progress(results) for row in rows)
+        >>> pooled([['a', 0], ['b', 1]]).update_filter({2: column(1) + 1}, column(1) > 0)
+        [['b', 1, 2]]
         """
         return (row for rows in progress(map(function, iterable)) for row in rows)
 
+    def _iter_update_filter( # pylint: disable=too-many-arguments,too-many-locals
+            self: metatable,
+            update: symbolism.symbol,
+            filter: symbolism.symbol, # pylint: disable=redefined-builtin
+            header: Optional[list] = None,
+            strict: Optional[bool] = False,
+            progress: Optional[Callable] = (lambda *a, **ka: a[0]),
+            parallel: Optional[int] = None,
+            rows: Optional[Iterable] = None,
+            width: int = 0
+        ) -> Iterable:
+        """
+        Internal method that yields the rows of the result of an update-then-filter
+        operation one at a time (see :obj:`iter_update_filter`). The operation is
+        applied to the supplied iterable of rows (or to the rows of this instance
+        if no iterable is supplied), every one of which (other than the header row)
+        is known to have at least ``width`` columns.
+
+        >>> t = metatable([['a', 0], ['b', 1], ['c', 2]])
+        >>> rows = t._iter_update_filter({2: row}, None, rows=[[0, 1], [2, 3]], width=2)
+        >>> list(rows)
+        [[0, 1, 0], [2, 3, 1]]
+        """
+        rows_in = iter(self) if rows is None else iter(rows)
+
+        # If the update task is a list (representing the operation that yields
+        # each column starting from the left-most one), convert it into a dictionary.
+        update = dict(enumerate(update)) if isinstance(update, (tuple, list)) else update
+
+        # Determine the column with the highest index in the update task and the
+        # columns to be dropped (in descending order of index), and derive the
+        # function that is applied to each row.
+        column_max = max(update) if update else -1
+        drops = metatable._drops(update)
+        function = metatable._function(update, filter, strict, width)
+
+        # Update the header row if it exists and no replacement header is specified.
+        if self.header and header is None:
+            for row_ in rows_in:
+                # Fill columns that are in the range but that have no expression
+                # in the update tasks (converting the header row into a list if
+                # it is not one, as is done for every other row).
+                row_ = row_ if isinstance(row_, list) else list(row_)
+                metatable._pad_row(row_, column_max)
+
+                # In strict mode, drop columns which do not appear in the update task.
+                if strict:
+                    row_ = row_[:max(column_max + 1, 0)]
+
+                # Drop columns in header as indicated in update specification.
+                for col in drops:
+                    del row_[col]
+
+                # Add only this header row.
+                yield row_
+                break
+        elif self.header and header is not None: # A replacement header has been specified.
+            rows_in = itertools.islice(rows_in, 1, None) # Skip the old header row.
+            yield header
+
+        # Distribute contiguous chunks of rows across processes if requested (the
+        # function is sent to each process and derived again there). The results
+        # for the chunks are concatenated so that progress is reported per row.
+        if parallel is not None and parallel > 1:
+            index_rows = list(enumerate(rows_in))
+            size = max(1, len(index_rows) // (parallel * 4))
+            with concurrent.futures.ProcessPoolExecutor(parallel) as executor:
+                yield from (
+                    row_
+                    for rows_ in progress(itertools.chain.from_iterable(executor.map(
+                        functools.partial(metatable._upd_chunk, function),
+                        (index_rows[i:i + size] for i in range(0, len(index_rows), size))
+                    )))
+                    for row_ in rows_
+                )
+            return
+
+        yield from self.map(function, enumerate(rows_in), progress)
+
+    def iter_update_filter( # pylint: disable=too-many-arguments
+            self: metatable,
+            update: symbolism.symbol,
+            filter: symbolism.symbol, # pylint: disable=redefined-builtin
+            header: Optional[list] = None,
+            strict: Optional[bool] = False,
+            progress: Optional[Callable] = (lambda *a, **ka: a[0]),
+            parallel: Optional[int] = None
+        ) -> Iterable:
+        """
+        Perform an update-then-filter operation (see :obj:`update_filter` for a
+        description of the parameters), yielding the rows of the result one at a
+        time. No list of rows is built and this instance is not replaced by the
+        result (though its rows may be updated in-place as they are produced), so
+        the caller can decide whether to retain the result. Consumers that only
+        require a prefix of the result only incur the cost of computing that prefix.
+
+        >>> t = metatable([['a', 0], ['b', 1], ['c', 2]])
+        >>> rows = t.iter_update_filter({0: column(1)}, column(1) > symbolism.symbol(0))
+        >>> next(rows)
+        [1, 1]
+        >>> list(rows)
+        [[2, 2]]
+        """
+        return self._iter_update_filter(
+            update, filter, header, strict, progress, parallel
+        )
+
     def update_filter( # pylint: disable=too-many-arguments
             self: metatable,
             update: symbolism.symbol,
             filter: symbolism.symbol, # pylint: disable=redefined-builtin
             header: Optional[list] = None,
             strict: Optional[bool] = False,
-            progress: Optional[Callable] = (lambda *a, **ka: a[0])
-        ) -> list:
+            progress: Optional[Callable] = (lambda *a, **ka: a[0]),
+            parallel: Optional[int] = None,
+            jit: Optional[bool] = False,
+            lazy: Optional[bool] = False
+        ) -> Union[list, metatable]:
         """
         Perform update-then-filter operations across the entire table, based on
         symbolic expressions for the update and filter task(s). The result of
-        the operation is returned.
+        the operation is returned (unless the operation is deferred, in which
+        case this instance is returned).
 
         :param update: Symbolic expression that represents an update operation
             (to be applied to every row).
@@ -157,6 +1331,15 @@ class metatable:
         :param header: Header row for the overall result of this method.
         :param strict: Drop columns that do not explicitly appear in the update expression.
         :param progress: Function that returns its iterable input and reports progress.
+        :param parallel: Number of processes across which the rows should be distributed
+            (rows are processed within the current process if this is ``None``). The
+            rows are distributed in contiguous chunks using a
+            :obj:`~concurrent.futures.ProcessPoolExecutor` (so :obj:`map` is not used).
+        :param jit: Compile each numeric update and filter expression into a single
+            loop over all rows using `Numba <https://numba.pydata.org>`__ (if it is
+            installed) when this instance was created using :obj:`from_columns`.
+        :param lazy: Defer the operation until this instance is next iterated over
+            or until the next operation that is not deferred.
 
         >>> t = metatable([['a', 0], ['b', 1], ['c', 2]])
         >>> t.update_filter({0: column(1)}, column(1) > symbolism.symbol(0))
@@ -176,74 +1359,172 @@ class metatable:
         [['a', None, None, 0], ['b', None, None, 1]]
         >>> list(t)
         [['a', None, None, 0], ['b', None, None, 1]]
-        """
-        (rows_in, rows_out) = (iter(self), [])
 
+        Rows that are not lists (such as tuples) are converted into lists.
+
+        >>> t = metatable([('a', 0), ('b', 1), ('c', 2)])
+        >>> t.update_filter({0: column(1)}, column(1) > 0)
+        [[1, 1], [2, 2]]
+        >>> metatable([('a', 0), ('b', 1)]).update_filter({0: column(1)}, None, strict=True)
+        [[0], [1]]
+        >>> metatable([['a', 0], ['b', 1]]).update_filter({-1: drop}, None, strict=True)
+        [[], []]
+
+        The rows can be distributed across multiple processes (in which case the
+        symbolic expressions and the rows must support serialization via
+        :obj:`pickle`).
+
+        >>> t = metatable([['a', 0], ['b', 1], ['c', 2]])
+        >>> t.update_filter({2: row}, column(1) > 0, parallel=2)
+        [['b', 1, 1], ['c', 2, 2]]
+
+        As when the rows are processed within the current process, progress is
+        reported for each row.
+
+        >>> def progress(results):
+        ...     for (count, result) in enumerate(results, 1):
+        ...         yield result
+        ...     print(count, 'rows')
+        >>> t.update({3: row}, progress=progress, parallel=2)
+        2 rows
+        [['b', 1, 1, 0], ['c', 2, 2, 1]]
+
+        For an instance created using :obj:`from_columns`, update and filter
+        expressions that consist only of arithmetic and comparison operators
+        applied to numeric constants and columns of :obj:`float` values can be
+        compiled into native code that evaluates each expression for all rows
+        within a single loop. Any other expressions are evaluated as usual, so
+        the results are always the same.
+
+        >>> t = metatable.from_columns([['a', 'b', 'c'], [0.5, 1.5, 2.5]])
+        >>> t.update_filter({2: column(1) * column(1)}, column(1) > 1, jit=True)
+        [['b', 1.5, 2.25], ['c', 2.5, 6.25]]
+        >>> t = metatable.from_columns([['a', 'b'], [2 ** 40, 1]])
+        >>> t.update_filter({2: column(1) * column(1)}, column(1) > 1, jit=True)
+        [['a', 1099511627776, 1208925819614629174706176]]
+
+        Consecutive operations can be deferred so that they are all performed
+        during a single pass over the rows (without building any intermediate
+        lists of rows).
+
+        >>> t = metatable([['a', 0], ['b', 1], ['c', 2]])
+        >>> t = t.update({2: column(1) * 2}, lazy=True)
+        >>> t.update_filter({0: drop}, column(2) > 1)
+        [[1, 2], [2, 4]]
+        >>> t = t.update({2: row}, lazy=True).update_filter({}, column(2) > 0, lazy=True)
+        >>> list(t)
+        [[2, 4, 1]]
+        """
         # If the update task is a list (representing the operation that yields
         # each column starting from the left-most one), convert it into a dictionary.
         update = dict(enumerate(update)) if isinstance(update, (tuple, list)) else update
 
-        # Determine the column with the highest index in the update task.
-        column_max = max(update.keys())
+        self._pending.append((update, filter, header, strict, progress, parallel, jit))
+        return self if lazy else self._flush()
 
-        # Update the header row if it exists and no replacement header is specified.
-        if self.header and header is None:
-            for row_ in rows_in:
-                # Fill columns that are in the range but that have no expression
-                # in the update tasks.
-                for col in update:
-                    while col > len(row_) - 1:
-                        row_.append(None)
-
-                # In strict mode, drop columns which do not appear in the update task.
-                if strict:
-                    row_ = [v for (c, v) in enumerate(row_) if c <= column_max]
-
-                # Drop columns in header as indicated in update specification.
-                drops = [col_ for (col_, upd) in update.items() if upd is drop]
-                row_ = [v for (c, v) in enumerate(row_) if c not in drops]
+    def _flush(self: metatable) -> list:
+        """
+        Internal method that performs all deferred update-then-filter operations
+        during a single pass over the rows of this instance. The result of the
+        operations is returned.
+        """
+        (stages, self._pending) = (self._pending, [])
 
-                # Add only this header row.
-                rows_out.append(row_)
-                break
-        elif self.header and header is not None: # A replacement header has been specified.
-            rows_in = itertools.islice(rows_in, 1, None) # Skip the old header row.
-            rows_out.append(header)
+        # Tables created from columns are updated column-wise if possible.
+        (update, filter_, header, strict, _, parallel, jit) = stages[0]
+        if (
+            len(stages) == 1 and self._arrays is not None and (parallel or 1) <= 1 and
+            self._update_columns(update, filter_, header, strict, jit)
+        ):
+            return list(self)
 
-        rows_out.extend(self.map(
-            metatable._upd,
-            zip(
-                itertools.repeat((update, filter, column_max if strict else None)),
-                enumerate(rows_in)
-            ),
-            progress
-        ))
+        # Determine the minimum width of the rows (other than the header row)
+        # produced by each stage, so that later stages can skip padding rows
+        # that are already wide enough. The width is known only for rows that
+        # are produced within this method (and not for rows in an iterable that
+        # may have been modified elsewhere).
+        width = len(self._arrays) if self._arrays is not None else 0
+        rows = None
+        for stage in stages:
+            rows = self._iter_update_filter(*stage[:6], rows=rows, width=width)
+            (update, strict) = (stage[0], stage[3])
+            column_max = max(update) if update else -1
+            width = (
+                (max(column_max + 1, 0) if strict else max(width, column_max + 1)) -
+                len(metatable._drops(update))
+            )
 
-        self.iterable = rows_out
-        return rows_out
+        self.iterable = list(rows)
+        return self._iterable
 
-    def update(
+    def update( # pylint: disable=too-many-arguments
             self: metatable,
             update: symbolism.symbol,
             header: Optional[list] = None,
             strict: Optional[bool] = False,
-            progress: Optional[Callable] = (lambda *a, **ka: a[0])
-        ) -> list:
+            progress: Optional[Callable] = (lambda *a, **ka: a[0]),
+            parallel: Optional[int] = None,
+            jit: Optional[bool] = False,
+            lazy: Optional[bool] = False
+        ) -> Union[list, metatable]:
         """
         Update operation across the entire table, based on a symbolic expression
-        for the update task(s).
+        for the update task(s). The result of the operation is returned (unless
+        the operation is deferred, in which case this instance is returned).
 
         :param update: Symbolic expression that represents an update operation
             (to be applied to every row).
         :param header: Header row for the overall result of this method.
         :param strict: Drop columns that do not explicitly appear in the update expression.
         :param progress: Function that returns its iterable input and reports progress.
+        :param parallel: Number of processes across which the rows should be distributed
+            (rows are processed within the current process if this is ``None``). The
+            rows are distributed in contiguous chunks using a
+            :obj:`~concurrent.futures.ProcessPoolExecutor` (so :obj:`map` is not used).
+        :param jit: Compile each numeric update and filter expression into a single
+            loop over all rows using `Numba <https://numba.pydata.org>`__ (if it is
+            installed) when this instance was created using :obj:`from_columns`.
+        :param lazy: Defer the operation until this instance is next iterated over
+            or until the next operation that is not deferred.
 
         >>> t = metatable([['a', 0], ['b', 1], ['c', 2]])
         >>> t.update({0: column(1)}) # Replace first-column value with second-column value.
         [[0, 0], [1, 1], [2, 2]]
         >>> list(t)
         [[0, 0], [1, 1], [2, 2]]
+        >>> metatable([('a', 0), ('b', 1)]).update({0: column(1)})
+        [[0, 0], [1, 1]]
+        >>> metatable([('c', 'n'), ('a', 0), ('b', 1)], header=True).update({0: drop})
+        [['n'], [0], [1]]
+
+        The rows that are returned can be modified before the next update.
+
+        >>> t = metatable([['a', 0], ['b', 1]])
+        >>> rows = t.update({1: column(0)})
+        >>> rows.append(['z'])
+        >>> t.update({2: column(1)})
+        [['a', 'a', 'a'], ['b', 'b', 'b'], ['z', None, None]]
+
+        Rows that are lists (including those supplied when the instance was
+        created) are updated in place. Thus, a list that appears more than once
+        among the rows is updated once for each appearance. Supply copies of the
+        rows (*e.g.*, ``[list(r) for r in rows]``) if this is not desired.
+
+        >>> r = ['a', 0]
+        >>> metatable([r, r]).update({2: row})
+        [['a', 0, 1], ['a', 0, 1]]
+        >>> r
+        ['a', 0, 1]
+
+        Every update task is evaluated using the original values in the row (even
+        if it refers to a column that is assigned by another update task).
+
+        >>> metatable([[9, 9]]).update({0: 1, 1: column(-2)})
+        [[1, 9]]
+        >>> metatable([[9, 9]]).update({-1: 1})
+        [[9, 1]]
+        >>> metatable([[9, 9]]).update({-1: drop})
+        [[9, 9]]
 
         If a header row is present (and should be preserved when performing the update),
         this can be indicated using the ``header`` argument.
@@ -262,6 +1543,11 @@ class metatable:
         >>> t = metatable([['a', 0, True], ['b', 1, True], ['c', 2, False]])
         >>> t.update([column(1), column(0), drop])
         [[0, 'a'], [1, 'b'], [2, 'c']]
+        >>> t = metatable([['a', 0, True], ['b', 1, True], ['c', 2, False]])
+        >>> t.update([column(1), column(0)])
+        [[0, 'a', True], [1, 'b', True], [2, 'c', False]]
+        >>> t.update({0: drop, 2: drop})
+        [['a'], ['b'], ['c']]
 
         If the ``strict`` argument is assigned the value ``True``, then columns
         that do not explicitly appear in the update task specification are dropped.
@@ -286,7 +1572,9 @@ class metatable:
         >>> t.update({2: symbolism.is_(column(1), None)})
         [['a', 0, False], ['b', None, True], ['c', 2, False]]
         """
-        return self.update_filter(update, None, header, strict, progress)
+        return self.update_filter(
+            update, None, header, strict, progress, parallel, jit, lazy
+        )
 
 class row: # pylint: disable=too-few-public-methods
     """
@@ -319,6 +1607,17 @@ class column(symbolism.symbol): # pylint: disable=too-few-public-methods
     >>> t.update_filter({0: column(1)}, column(1) > symbolism.symbol(0))
     [[1, 1], [2, 2]]
     """
+    def __init__(self: column, instance: Any):
+        """
+        Create a column specifier. The specifier is retained directly (so
+        that it need not be obtained via :obj:`~symbolism.symbol.evaluate`
+        each time a row is accessed).
+
+        >>> column(1)._index
+        1
+        """
+        super().__init__(instance)
+        self._index = instance
 
 if __name__ == '__main__':
     doctest.testmod() # pragma: no cover